@@ -2,10 +2,16 @@ import sys
 import os
 import json
 import uuid
+import shutil
+import struct
+import asyncio
+import threading
+import time
+import re
 import requests
-import subprocess
-import signal
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+import aiohttp
+from urllib.parse import urljoin
 import html
 from PyQt5.QtWidgets import (QApplication, QWidget, QLabel, QLineEdit, 
                             QPushButton, QVBoxLayout, QHBoxLayout, 
@@ -13,26 +19,48 @@ from PyQt5.QtWidgets import (QApplication, QWidget, QLabel, QLineEdit,
                             QTableWidgetItem, QHeaderView, QFrame,
                             QStyle, QStyleFactory, QSystemTrayIcon,
                             QDialog, QDateTimeEdit, QSpinBox, QDialogButtonBox)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer, QObject, QSize
-from PyQt5.QtGui import QFont, QIcon, QPalette, QColor, QPixmap
-from queue import Queue
+from PyQt5.QtCore import (Qt, QThread, pyqtSignal, QTimer, QObject, QSize,
+                          QRunnable, QThreadPool, QSaveFile, QIODevice)
+from PyQt5.QtGui import QFont, QIcon, QPalette, QColor, QPixmap, QImage
+from functools import lru_cache
 import logging
 from datetime import datetime, timedelta
 from io import BytesIO
 
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
 
-class StatusUpdateWorker(QObject):
-    update_signal = pyqtSignal(str, str)
-
-    def __init__(self):
-        super().__init__()
-        self.queue = Queue()
-
-    def process_updates(self):
-        while not self.queue.empty():
-            status, filename = self.queue.get()
-            self.update_signal.emit(status, filename)
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=64))
+SESSION.mount('http://', HTTPAdapter(pool_connections=32, pool_maxsize=64))
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)',
+    'Accept-Encoding': 'gzip, deflate'
+})
+
+_OG_DESC = re.compile(rb'<meta[^>]+property=["\']og:description["\'][^>]+content=["\']([^"\']*)', re.I)
+_OG_IMAGE = re.compile(rb'<meta[^>]+property=["\']og:image["\'][^>]+content=["\']([^"\']*)', re.I)
+_STREAM_URL_RE = re.compile(r'^https://.*\d\s*$')
+_ONE_OVER_MB = 1.0 / (1 << 20)
+# total_recordings, total_duration (s), total_size (KB) as fixed-width integers.
+_STATS_STRUCT = struct.Struct('<QQQ')
+
+@lru_cache(maxsize=256)
+def _load_thumb(path):
+    """Decode and scale a profile image once per path; the QPixmap is shared across rows."""
+    pixmap = QPixmap(path)
+    return pixmap.scaled(80, 80, Qt.KeepAspectRatio, Qt.FastTransformation)
+
+def _pick_hd(urls):
+    """Filter valid stream URLs from the API response, preferring the hd.m3u8 variant."""
+    valid_urls = []
+    hd_url = None
+    if isinstance(urls, list):
+        for url in urls:
+            if isinstance(url, str) and _STREAM_URL_RE.match(url):
+                valid_urls.append(url)
+                if 'hd.m3u8' in url:
+                    hd_url = url
+    return valid_urls, hd_url
 
 class StreamInfoExtractor:
     @staticmethod
@@ -41,29 +69,22 @@ class StreamInfoExtractor:
             if url.startswith("view-source:"):
                 url = url[12:]
             
-            response = requests.get(url)
+            response = SESSION.get(url, timeout=10)
             if response.status_code != 200:
                 raise Exception(f"Failed to retrieve the page: {url}")
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            og_description_tag = soup.find('meta', property='og:description')
-            og_image_tag = soup.find('meta', property='og:image')
-            
-            if not og_description_tag:
+            og_description_match = _OG_DESC.search(response.content)
+            og_image_match = _OG_IMAGE.search(response.content)
+
+            if not og_description_match:
                 raise Exception("No 'og:description' meta tag found.")
-            
-            description_content = html.unescape(og_description_tag.get('content'))
-            parts = description_content.split(" ")
-            join_index = parts.index("Join")
-            and_index = parts.index("&")
-            
-            user_parts = []
-            for i in range(join_index + 1, and_index):
-                if parts[i] != "&":
-                    user_parts.append(parts[i])
-            
-            username = " ".join(user_parts).strip()
-            image_url = og_image_tag.get('content') if og_image_tag else None
+
+            description_content = html.unescape(og_description_match.group(1).decode('utf-8', 'replace'))
+            after_join = description_content.partition("Join ")[2]
+            username = after_join.partition(" &")[0].strip()
+            if not username:
+                raise Exception("Could not find username in 'og:description' content.")
+            image_url = og_image_match.group(1).decode('utf-8', 'replace') if og_image_match else None
             
             return username, image_url
         except Exception as e:
@@ -80,14 +101,17 @@ class StreamInfoExtractor:
                 os.makedirs(folder_path)
             
             if image_url:
-                try:
-                    image_response = requests.get(image_url)
-                    if image_response.status_code == 200:
-                        image_filename = os.path.join(folder_path, f"{username}_profile.png")
-                        with open(image_filename, 'wb') as f:
-                            f.write(image_response.content)
-                except Exception as e:
-                    logging.error(f"Error downloading profile image: {e}")
+                image_filename = os.path.join(folder_path, f"{username}_profile.png")
+                if not os.path.exists(image_filename):
+                    try:
+                        with SESSION.get(image_url, stream=True, timeout=10) as image_response:
+                            if image_response.status_code == 200:
+                                # Undo any transfer encoding; raw is the socket stream.
+                                image_response.raw.decode_content = True
+                                with open(image_filename, 'wb', buffering=1 << 16) as f:
+                                    shutil.copyfileobj(image_response.raw, f, length=65536)
+                    except Exception as e:
+                        logging.error(f"Error downloading profile image: {e}")
             
             stream_id = url.split('/')[-1]
             
@@ -100,116 +124,262 @@ class StreamInfoExtractor:
             logging.error(f"Error getting stream info: {e}")
             raise
 
-class RecordingThread(QThread):
+class RecordingSupervisor(QThread):
+    """Single thread running a shared asyncio loop that supervises every recording.
+
+    All recordings share one aiohttp session so TCP/TLS connections are reused
+    across segments and streams instead of one ffmpeg process per stream.
+    """
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+            cls._instance.start()
+            cls._instance._ready.wait()
+        return cls._instance
+
+    def __init__(self):
+        super().__init__()
+        self.loop = None
+        self.session = None
+        self._ready = threading.Event()
+        self._shutdown = None
+
+    def run(self):
+        asyncio.run(self._main())
+
+    async def _main(self):
+        self.loop = asyncio.get_running_loop()
+        self._shutdown = asyncio.Event()
+        connector = aiohttp.TCPConnector(limit=0, keepalive_timeout=60)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            self.session = session
+            self._ready.set()
+            await self._shutdown.wait()
+
+    def submit(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def shutdown(self):
+        if self.loop is not None and self._shutdown is not None:
+            self.loop.call_soon_threadsafe(self._shutdown.set)
+            self.wait()
+
+class RecordingTask(QObject):
     update_status = pyqtSignal(str, str)
-    update_duration = pyqtSignal(str, int)
-    update_file_size = pyqtSignal(str, float)
-    start_timer = pyqtSignal()
-    stop_timer = pyqtSignal()
-    
+
+    SYNC_INTERVAL = 5.0
+
     def __init__(self, stream_url, output_file, max_duration=None, max_retries=3):
         super().__init__()
         self.stream_url = stream_url
         self.output_file = output_file
         self.max_duration = max_duration
-        self.process = None
         self.stop_recording = False
         self.recording_duration = 0
+        self.bytes_written = 0
         self.max_retries = max_retries
         self.retry_count = 0
-        
-        self.duration_timer = QTimer()
-        self.duration_timer.timeout.connect(self.update_recording_duration)
-        self.duration_timer.moveToThread(QApplication.instance().thread())
-        
-        self.start_timer.connect(self.duration_timer.start)
-        self.stop_timer.connect(self.duration_timer.stop)
+        self._future = None
 
-    def update_recording_duration(self):
-        self.recording_duration += 1
-        self.update_duration.emit(self.output_file, self.recording_duration)
+    def start(self):
+        supervisor = RecordingSupervisor.instance()
+        self._future = supervisor.submit(self._record(supervisor.session))
 
-    def run(self):
-        while self.retry_count < self.max_retries and not self.stop_recording:
+    def isRunning(self):
+        return self._future is not None and not self._future.done()
+
+    def wait(self):
+        if self._future is not None:
             try:
-                self.recording_duration = 0
-                self.start_timer.emit()
-                
-                ffmpeg_command = [
-                    'ffmpeg',
-                    '-hide_banner',
-                    '-loglevel', 'panic',
-                    '-i', self.stream_url,
-                    '-c', 'copy',
-                    '-vsync', '0',
-                    '-copyts',
-                    '-avoid_negative_ts', 'make_zero'
-                ]
-
-                if self.max_duration:
-                    ffmpeg_command.extend(['-t', str(self.max_duration)])
-
-                ffmpeg_command.extend([
-                    '-fflags', '+genpts',
-                    '-hls_time', '2',
-                    '-hls_flags', 'split_by_time',
-                    self.output_file
-                ])
-
-                self.process = subprocess.Popen(
-                    ffmpeg_command,
-                    stdin=subprocess.PIPE,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    universal_newlines=True
-                )
-                
-                while self.process.poll() is None and not self.stop_recording:
-                    self.msleep(100)
-                    if os.path.exists(self.output_file):
-                        size_mb = os.path.getsize(self.output_file) / (1024 * 1024)
-                        self.update_file_size.emit(self.output_file, size_mb)
-                
-                if self.process and not self.stop_recording:
-                    self.process.wait()
-                    self.update_status.emit('completed', self.output_file)
-                elif self.process:
-                    if os.name == 'nt':
-                        self.process.send_signal(signal.CTRL_C_EVENT)
+                self._future.result()
+            except (Exception, asyncio.CancelledError):
+                # CancelledError subclasses BaseException, not Exception.
+                pass
+
+    @staticmethod
+    def _parse_playlist(text):
+        target_duration = 2.0
+        segments = []
+        ended = False
+        expect_uri = False
+        for line in text.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith('#EXT-X-TARGETDURATION:'):
+                try:
+                    target_duration = float(line.split(':', 1)[1])
+                except ValueError:
+                    pass
+            elif line.startswith('#EXTINF:'):
+                expect_uri = True
+            elif line.startswith('#EXT-X-ENDLIST'):
+                ended = True
+            elif not line.startswith('#') and expect_uri:
+                segments.append(line)
+                expect_uri = False
+        return target_duration, segments, ended
+
+    async def _download(self, session):
+        timeout = aiohttp.ClientTimeout(total=30)
+        seen_segments = set()
+        started = time.monotonic()
+        f = open(self.output_file, 'ab', buffering=1 << 20)
+        self.bytes_written = f.tell()
+        last_sync = started
+        try:
+            while not self.stop_recording:
+                async with session.get(self.stream_url, timeout=timeout) as response:
+                    response.raise_for_status()
+                    playlist = await response.text()
+
+                target_duration, segments, ended = self._parse_playlist(playlist)
+
+                for segment in segments:
+                    if segment in seen_segments or self.stop_recording:
+                        continue
+                    seen_segments.add(segment)
+                    segment_url = urljoin(self.stream_url, segment)
+                    async with session.get(segment_url, timeout=timeout) as response:
+                        response.raise_for_status()
+                        async for chunk in response.content.iter_chunked(65536):
+                            f.write(chunk)
+                    self.bytes_written = f.tell()
+
+                # Live playlists are a sliding window and expired segments never
+                # reappear, so forget anything that dropped out of the window.
+                seen_segments.intersection_update(segments)
+
+                now = time.monotonic()
+                if now - last_sync >= self.SYNC_INTERVAL:
+                    f.flush()
+                    os.fsync(f.fileno())
+                    last_sync = now
+
+                self.recording_duration = int(now - started)
+
+                if ended:
+                    break
+                if self.max_duration and self.recording_duration >= self.max_duration:
+                    break
+
+                await asyncio.sleep(target_duration / 2)
+        finally:
+            f.close()
+
+    async def _record(self, session):
+        try:
+            while self.retry_count < self.max_retries and not self.stop_recording:
+                try:
+                    self.recording_duration = 0
+                    await self._download(session)
+
+                    if self.stop_recording:
+                        self.update_status.emit('stopped', self.output_file)
                     else:
-                        self.process.send_signal(signal.SIGINT)
-                    
-                    self.process.wait()
-                    self.update_status.emit('stopped', self.output_file)
-                
-                if self.process.returncode != 0 and not self.stop_recording:
+                        self.update_status.emit('completed', self.output_file)
+                    break
+
+                except Exception as e:
                     self.retry_count += 1
-                    self.update_status.emit('reconnecting', self.output_file)
-                    self.msleep(5000)
-                    continue
-                break
-                
-            except Exception as e:
-                self.retry_count += 1
-                logging.error(f"Error in RecordingThread (attempt {self.retry_count}): {e}")
-                if self.retry_count >= self.max_retries:
-                    self.update_status.emit('error', str(e))
-                else:
-                    self.update_status.emit('reconnecting', self.output_file)
-                    self.msleep(5000)
-            finally:
-                self.stop_timer.emit()
-                if self.process:
-                    try:
-                        self.process.terminate()
-                    except:
-                        pass
+                    logging.error(f"Error in RecordingTask (attempt {self.retry_count}): {e}")
+                    if self.retry_count >= self.max_retries:
+                        self.update_status.emit('error', self.output_file)
+                    else:
+                        self.update_status.emit('reconnecting', self.output_file)
+                        await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            self.update_status.emit('stopped', self.output_file)
+            raise
 
     def stop(self):
         self.stop_recording = True
-        self.stop_timer.emit()
-        if self.process:
-            self.process.terminate()
+        # Cancel the task so it does not linger in a refresh/backoff sleep or
+        # a hanging request; the flag alone is only checked between awaits.
+        if self._future is not None and not self._future.done():
+            supervisor = RecordingSupervisor._instance
+            if supervisor is not None and supervisor.loop is not None:
+                supervisor.loop.call_soon_threadsafe(self._future.cancel)
+
+class AddStreamJobSignals(QObject):
+    finished = pyqtSignal(object, dict)
+    failed = pyqtSignal(object, str)
+
+class AddStreamJob(QRunnable):
+    """Resolves stream info and playable URLs off the GUI thread."""
+
+    def __init__(self, stream_url, max_duration=None):
+        super().__init__()
+        self.stream_url = stream_url
+        self.max_duration = max_duration
+        self.signals = AddStreamJobSignals()
+
+    def run(self):
+        try:
+            info = StreamInfoExtractor.get_stream_info(self.stream_url)
+
+            api_url = f'http://localhost/tango.php?streamid={info["stream_id"]}'
+            response = SESSION.get(api_url, timeout=10)
+            data = response.json()
+
+            valid_urls, hd_url = _pick_hd(data.get('urls'))
+
+            self.signals.finished.emit(self, {
+                'stream_url': self.stream_url,
+                'max_duration': self.max_duration,
+                'info': info,
+                'valid_urls': valid_urls,
+                'hd_url': hd_url
+            })
+        except Exception as e:
+            logging.error(f"Error resolving stream {self.stream_url}: {e}")
+            self.signals.failed.emit(self, str(e))
+
+class RestoreStreamJobSignals(QObject):
+    ready = pyqtSignal(object, dict)
+
+class RestoreStreamJob(QRunnable):
+    """Prepares a saved stream for restore off the GUI thread.
+
+    Decodes the profile image as a QImage (safe outside the GUI thread);
+    the main thread converts it to a QPixmap when inserting the row.
+    """
+
+    def __init__(self, stream_data):
+        super().__init__()
+        self.stream_data = stream_data
+        self.signals = RestoreStreamJobSignals()
+
+    def run(self):
+        try:
+            stream_data = self.stream_data
+            output_file = stream_data['output_file']
+
+            valid_urls, hd_url = _pick_hd(stream_data.get('urls', []))
+            hd_stream = hd_url if hd_url else valid_urls[0] if valid_urls else stream_data['hd_stream']
+            username = stream_data.get('username', 'Unknown')
+
+            image = None
+            image_path = os.path.join(os.path.dirname(output_file), f"{username}_profile.png")
+            if os.path.exists(image_path):
+                image = QImage(image_path)
+                if not image.isNull():
+                    image = image.scaled(80, 80, Qt.KeepAspectRatio, Qt.FastTransformation)
+                else:
+                    image = None
+
+            self.signals.ready.emit(self, {
+                'output_file': output_file,
+                'stream_url': stream_data['stream_url'],
+                'hd_stream': hd_stream,
+                'username': username,
+                'image': image
+            })
+        except Exception as e:
+            logging.error(f"Error preparing saved stream: {e}")
 
 class ScheduleDialog(QDialog):
     def __init__(self, parent=None):
@@ -242,15 +412,24 @@ class TangoVideoRecorder(QWidget):
         self.recordings = {}
         self.streams_file = 'stream_links.json'
         self.output_dir = ''
-        self.status_worker = StatusUpdateWorker()
-        self.status_worker.update_signal.connect(self.update_recording_status)
-        self.update_timer = QTimer(self)
-        self.update_timer.timeout.connect(self.status_worker.process_updates)
-        self.update_timer.start(100)
+        self.tick = QTimer(self)
+        self.tick.timeout.connect(self._tick)
+        self.tick.start(1000)
+        self._pending_jobs = set()
+        self._save_pending = False
+        self._stats_dirty = False
+        self._stats_msgbox = None
+        self._stats_text_cache = None
+        self._schedule_dialog = None
+        self.stats_timer = QTimer(self)
+        self.stats_timer.timeout.connect(self._flush_stats_if_dirty)
+        self.stats_timer.start(5000)
+        QThreadPool.globalInstance().setMaxThreadCount(8)
         self.tray_icon = QSystemTrayIcon(self)
         self.tray_icon.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
         self.tray_icon.show()
-        self.stats_file = 'recording_stats.json'
+        self.stats_file = 'recording_stats.bin'
+        self.legacy_stats_file = 'recording_stats.json'
         self.stats = {
             'total_recordings': 0,
             'total_duration': 0,
@@ -292,6 +471,15 @@ class TangoVideoRecorder(QWidget):
             QPushButton:disabled {
                 background-color: #6c757d;
             }
+            QPushButton#stopBtn {
+                background-color: #dc3545;
+            }
+            QPushButton#stopBtn:hover {
+                background-color: #bb2d3b;
+            }
+            QPushButton#stopBtn:pressed {
+                background-color: #a52834;
+            }
             QTableWidget {
                 background-color: #363636;
                 border: 1px solid #555555;
@@ -381,6 +569,7 @@ class TangoVideoRecorder(QWidget):
         for i in range(1, self.streams_table.columnCount()):
             self.streams_table.horizontalHeader().setSectionResizeMode(i, QHeaderView.Stretch)
         
+        self.streams_table.setSortingEnabled(False)
         self.streams_table.setAlternatingRowColors(True)
         self.streams_table.setStyleSheet("""
             QTableWidget {
@@ -410,9 +599,8 @@ class TangoVideoRecorder(QWidget):
             self.output_path.setText(directory)
 
     def format_duration(self, seconds):
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        seconds = seconds % 60
+        minutes, seconds = divmod(seconds, 60)
+        hours, minutes = divmod(minutes, 60)
         if hours > 0:
             return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
         return f"{minutes:02d}:{seconds:02d}"
@@ -424,70 +612,65 @@ class TangoVideoRecorder(QWidget):
             QMessageBox.warning(self, 'Error', 'Please enter a stream URL')
             return
 
+        max_duration = self.duration_input.text().strip() or None
+        if max_duration:
+            try:
+                max_duration = int(max_duration)
+            except ValueError:
+                QMessageBox.warning(self, 'Error', 'Duration must be a number')
+                return
+
+        job = AddStreamJob(stream_url, max_duration)
+        job.signals.finished.connect(self._on_stream_resolved)
+        job.signals.failed.connect(self._on_stream_failed)
+        self._pending_jobs.add(job)
+        QThreadPool.globalInstance().start(job)
+
+    def _on_stream_failed(self, job, error):
+        self._pending_jobs.discard(job)
+        QMessageBox.warning(self, 'Error', f'Failed to add stream: {error}')
+
+    def _on_stream_resolved(self, job, result):
+        self._pending_jobs.discard(job)
+        stream_url = result['stream_url']
+        info = result['info']
+        max_duration = result['max_duration']
+
         try:
-            info = StreamInfoExtractor.get_stream_info(stream_url)
-            
             self.output_dir = info['folder_path']
             self.output_path.setText(self.output_dir)
-            
-            api_url = f'http://localhost/tango.php?streamid={info["stream_id"]}'
-            response = requests.get(api_url)
-            data = response.json()
 
-            valid_urls = []
-            hd_url = None
-            if isinstance(data.get('urls'), list):
-                for url in data['urls']:
-                    if (isinstance(url, str) and 
-                        url.startswith('https://') and 
-                        url.rstrip().endswith(tuple(str(i) for i in range(10)))):
-                        valid_urls.append(url)
-                        
-                        if 'hd.m3u8' in url:
-                            hd_url = url
-
-            if not valid_urls:
+            if not result['valid_urls']:
                 QMessageBox.warning(self, 'Error', 'No valid stream URL found')
                 return
 
-            hd_stream = hd_url if hd_url else valid_urls[0]
+            hd_stream = result['hd_url'] if result['hd_url'] else result['valid_urls'][0]
 
             random_filename = f'{info["username"]}_{uuid.uuid4()}.ts'
             output_file = os.path.join(self.output_dir, random_filename)
 
-            max_duration = self.duration_input.text().strip() or None
-            if max_duration:
-                try:
-                    max_duration = int(max_duration)
-                except ValueError:
-                    QMessageBox.warning(self, 'Error', 'Duration must be a number')
-                    return
-
-            recording_thread = RecordingThread(hd_stream, output_file, max_duration)
-            recording_thread.update_status.connect(self.queue_status_update)
-            recording_thread.update_duration.connect(self.update_duration)
-            recording_thread.update_file_size.connect(self.update_file_size)
+            recording_thread = RecordingTask(hd_stream, output_file, max_duration)
+            recording_thread.update_status.connect(self.update_recording_status, Qt.QueuedConnection)
             recording_thread.start()
 
-            profile_image = None
-            try:
-                image_path = os.path.join(info['folder_path'], f"{info['username']}_profile.png")
-                if os.path.exists(image_path):
-                    profile_image = QPixmap(image_path)
-                    profile_image = profile_image.scaled(80, 80, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            except Exception as e:
-                logging.error(f"Error loading profile image: {e}")
+            image_path = os.path.join(info['folder_path'], f"{info['username']}_profile.png")
+            profile_image = _load_thumb(image_path) if os.path.exists(image_path) else None
 
+            self.streams_table.setUpdatesEnabled(False)
             row = self.streams_table.rowCount()
             self.streams_table.insertRow(row)
-            self.recordings[random_filename] = {
+            duration_item = QTableWidgetItem('00:00')
+            size_item = QTableWidgetItem('0.0')
+            self.recordings[output_file] = {
                 'thread': recording_thread,
                 'stream_url': stream_url,
                 'hd_stream': hd_stream,
                 'output_file': output_file,
-                'row': row,
                 'username': info['username'],
-                'duration': 0
+                'duration': 0,
+                'duration_item': duration_item,
+                'size_item': size_item,
+                'size_text': '0.0'
             }
 
             if profile_image:
@@ -496,71 +679,59 @@ class TangoVideoRecorder(QWidget):
                 image_label.setAlignment(Qt.AlignCenter)
                 self.streams_table.setCellWidget(row, 0, image_label)
                 self.streams_table.setItem(row, 1, QTableWidgetItem(f"{info['username']} - {stream_url}"))
-                self.streams_table.setItem(row, 2, QTableWidgetItem('Recording'))
-                self.streams_table.setItem(row, 3, QTableWidgetItem('00:00'))
-                self.streams_table.setItem(row, 4, QTableWidgetItem('0.0'))
             else:
                 self.streams_table.setItem(row, 0, QTableWidgetItem(info['username']))
                 self.streams_table.setItem(row, 1, QTableWidgetItem(stream_url))
-                self.streams_table.setItem(row, 2, QTableWidgetItem('Recording'))
-                self.streams_table.setItem(row, 3, QTableWidgetItem('00:00'))
-                self.streams_table.setItem(row, 4, QTableWidgetItem('0.0'))
-            
+            self.streams_table.setItem(row, 2, QTableWidgetItem('Recording'))
+            self.streams_table.setItem(row, 3, duration_item)
+            self.streams_table.setItem(row, 4, size_item)
+
+
             stop_button = QPushButton('Stop')
+            stop_button.setObjectName('stopBtn')
             stop_button.setIcon(self.style().standardIcon(QStyle.SP_MediaStop))
-            stop_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #dc3545;
-                }
-                QPushButton:hover {
-                    background-color: #bb2d3b;
-                }
-                QPushButton:pressed {
-                    background-color: #a52834;
-                }
-            """)
-            stop_button.clicked.connect(lambda _, f=random_filename: self.stop_recording(f))
+            stop_button.clicked.connect(lambda _, f=output_file: self.stop_recording(f))
             self.streams_table.setCellWidget(row, 6, stop_button)
+            self.streams_table.setUpdatesEnabled(True)
 
             # Save stream info
-            self.save_streams()
+            self._request_save()
 
         except Exception as e:
+            self.streams_table.setUpdatesEnabled(True)
             logging.error(f"Error adding stream: {e}")
             QMessageBox.warning(self, 'Error', f'Failed to add stream: {str(e)}')
 
-    def queue_status_update(self, status, filename):
-        self.status_worker.queue.put((status, filename))
+    def _recording_row(self, recording):
+        # Row indices shift whenever a row is removed, so resolve the current
+        # row from one of the recording's own items instead of caching an index.
+        return self.streams_table.row(recording['duration_item'])
 
     def update_recording_status(self, status, filename):
         try:
-            basename = os.path.basename(filename)
-            if basename in self.recordings:
-                row = self.recordings[basename]['row']
+            recording = self.recordings.get(filename)
+            if recording is not None:
+                row = self._recording_row(recording)
                 if status in ['stopped', 'completed', 'error']:
-                    self.streams_table.setItem(row, 1, QTableWidgetItem(status.capitalize()))
-                    
-                    if self.streams_table.cellWidget(row, 6):
-                        self.streams_table.removeCellWidget(row, 6)
-                    
-                    if status == 'completed' and basename in self.recordings:
-                        duration = self.recordings[basename]['duration']
+                    if status == 'completed':
+                        duration = recording['duration']
                         size = 0
-                        if os.path.exists(self.recordings[basename]['output_file']):
-                            size = os.path.getsize(self.recordings[basename]['output_file']) / (1024 * 1024)
+                        if os.path.exists(recording['output_file']):
+                            size = os.path.getsize(recording['output_file']) * _ONE_OVER_MB
                         self.update_stats(duration, size)
-                    
-                    if basename in self.recordings:
-                        del self.recordings[basename]
+
+                    if row >= 0:
+                        self.streams_table.removeRow(row)
+                    del self.recordings[filename]
                 else:
                     self.streams_table.setItem(row, 1, QTableWidgetItem(status.capitalize()))
-                
-                self.save_streams()
+
+                self._request_save()
             
             if status in ['completed', 'error']:
                 self.tray_icon.showMessage(
                     'Recording Status',
-                    f'Recording {basename} has {status}',
+                    f'Recording {os.path.basename(filename)} has {status}',
                     QSystemTrayIcon.Information,
                     3000
                 )
@@ -576,32 +747,42 @@ class TangoVideoRecorder(QWidget):
                     recording['thread'].stop()
                     recording['thread'].wait()
                 
-                row = recording['row']
-                self.streams_table.setItem(row, 1, QTableWidgetItem('Stopped'))
-                
-                if self.streams_table.cellWidget(row, 6):
-                    self.streams_table.cellWidget(row, 6).setEnabled(False)
-                
-                self.queue_status_update('stopped', recording['output_file'])
+                self.update_recording_status('stopped', recording['output_file'])
                 
         except Exception as e:
             logging.error(f"Error stopping recording: {e}")
             QMessageBox.critical(self, 'Error', f"Recording stop failed: {str(e)}")
 
-    def save_streams(self):
+    def _request_save(self):
+        if not self._save_pending:
+            self._save_pending = True
+            QTimer.singleShot(1000, self._flush_save)
+
+    def _flush_save(self):
+        self._save_pending = False
+        self.save_streams()
+
+    def save_streams(self, pretty=False):
         try:
             streams_data = []
-            for filename, recording in self.recordings.items():
+            for recording in self.recordings.values():
                 streams_data.append({
-                    'filename': filename,
+                    'filename': os.path.basename(recording['output_file']),
                     'stream_url': recording['stream_url'],
                     'hd_stream': recording['hd_stream'],
                     'output_file': recording['output_file'],
                     'username': recording['username']
                 })
-            
-            with open(self.streams_file, 'w') as f:
-                json.dump(streams_data, f, indent=4)
+
+            if pretty:
+                payload = json.dumps(streams_data, indent=4).encode('utf-8')
+            else:
+                payload = json.dumps(streams_data, separators=(',', ':')).encode('utf-8')
+
+            tmp_file = self.streams_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_file, self.streams_file)
         except Exception as e:
             logging.error(f"Error saving streams: {e}")
 
@@ -611,56 +792,41 @@ class TangoVideoRecorder(QWidget):
                 with open(self.streams_file, 'r') as f:
                     streams_data = json.load(f)
                 for stream in streams_data:
-                    self.add_stream_from_data(stream)
+                    job = RestoreStreamJob(stream)
+                    job.signals.ready.connect(self._on_stream_restored)
+                    self._pending_jobs.add(job)
+                    QThreadPool.globalInstance().start(job)
             except Exception as e:
                 logging.error(f"Error loading streams: {e}")
 
-    def add_stream_from_data(self, stream_data):
+    def _on_stream_restored(self, job, result):
+        self._pending_jobs.discard(job)
         try:
-            random_filename = stream_data['filename']
-            output_file = stream_data['output_file']
-            stream_url = stream_data['stream_url']
-            
-            urls = stream_data.get('urls', [])
-            valid_urls = []
-            hd_url = None
-            if isinstance(urls, list):
-                for url in urls:
-                    if (isinstance(url, str) and 
-                        url.startswith('https://') and 
-                        url.rstrip().endswith(tuple(str(i) for i in range(10)))):
-                        valid_urls.append(url)
-
-                        if 'hd.m3u8' in url:
-                            hd_url = url
-            
-            hd_stream = hd_url if hd_url else valid_urls[0] if valid_urls else stream_data['hd_stream']
-            username = stream_data.get('username', 'Unknown')
+            output_file = result['output_file']
+            stream_url = result['stream_url']
+            hd_stream = result['hd_stream']
+            username = result['username']
 
-            profile_image = None
-            try:
-                image_path = os.path.join(os.path.dirname(output_file), f"{username}_profile.png")
-                if os.path.exists(image_path):
-                    profile_image = QPixmap(image_path)
-                    profile_image = profile_image.scaled(80, 80, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            except Exception as e:
-                logging.error(f"Error loading profile image: {e}")
+            profile_image = QPixmap.fromImage(result['image']) if result['image'] is not None else None
 
-            recording_thread = RecordingThread(hd_stream, output_file)
-            recording_thread.update_status.connect(self.queue_status_update)
-            recording_thread.update_duration.connect(self.update_duration)
-            recording_thread.update_file_size.connect(self.update_file_size)
+            recording_thread = RecordingTask(hd_stream, output_file)
+            recording_thread.update_status.connect(self.update_recording_status, Qt.QueuedConnection)
 
+            self.streams_table.setUpdatesEnabled(False)
             row = self.streams_table.rowCount()
             self.streams_table.insertRow(row)
-            self.recordings[random_filename] = {
+            duration_item = QTableWidgetItem('00:00')
+            size_item = QTableWidgetItem('0.0')
+            self.recordings[output_file] = {
                 'thread': recording_thread,
                 'stream_url': stream_url,
                 'hd_stream': hd_stream,
                 'output_file': output_file,
-                'row': row,
                 'username': username,
-                'duration': 0
+                'duration': 0,
+                'duration_item': duration_item,
+                'size_item': size_item,
+                'size_text': '0.0'
             }
 
             if profile_image:
@@ -669,56 +835,39 @@ class TangoVideoRecorder(QWidget):
                 image_label.setAlignment(Qt.AlignCenter)
                 self.streams_table.setCellWidget(row, 0, image_label)
                 self.streams_table.setItem(row, 1, QTableWidgetItem(f"{username} - {stream_url}"))
-                self.streams_table.setItem(row, 2, QTableWidgetItem('Recording'))
-                self.streams_table.setItem(row, 3, QTableWidgetItem('00:00'))
-                self.streams_table.setItem(row, 4, QTableWidgetItem('0.0'))
             else:
                 self.streams_table.setItem(row, 0, QTableWidgetItem(username))
                 self.streams_table.setItem(row, 1, QTableWidgetItem(stream_url))
-                self.streams_table.setItem(row, 2, QTableWidgetItem('Recording'))
-                self.streams_table.setItem(row, 3, QTableWidgetItem('00:00'))
-                self.streams_table.setItem(row, 4, QTableWidgetItem('0.0'))
-            
+            self.streams_table.setItem(row, 2, QTableWidgetItem('Recording'))
+            self.streams_table.setItem(row, 3, duration_item)
+            self.streams_table.setItem(row, 4, size_item)
+
+
             stop_button = QPushButton('Stop')
+            stop_button.setObjectName('stopBtn')
             stop_button.setIcon(self.style().standardIcon(QStyle.SP_MediaStop))
-            stop_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #dc3545;
-                }
-                QPushButton:hover {
-                    background-color: #bb2d3b;
-                }
-                QPushButton:pressed {
-                    background-color: #a52834;
-                }
-            """)
-            stop_button.clicked.connect(lambda _, f=random_filename: self.stop_recording(f))
+            stop_button.clicked.connect(lambda _, f=output_file: self.stop_recording(f))
             self.streams_table.setCellWidget(row, 6, stop_button)
+            self.streams_table.setUpdatesEnabled(True)
 
             recording_thread.start()
 
         except Exception as e:
-            logging.error(f"Error adding stream from data: {e}")
-
-    def update_duration(self, output_file, duration):
-        try:
-            basename = os.path.basename(output_file)
-            if basename in self.recordings:
-                row = self.recordings[basename]['row']
-                self.recordings[basename]['duration'] = duration
-                duration_text = self.format_duration(duration)
-                self.streams_table.setItem(row, 2, QTableWidgetItem(duration_text))
-        except Exception as e:
-            logging.error(f"Error updating duration: {e}")
+            self.streams_table.setUpdatesEnabled(True)
+            logging.error(f"Error restoring saved stream: {e}")
 
-    def update_file_size(self, output_file, size_mb):
+    def _tick(self):
         try:
-            basename = os.path.basename(output_file)
-            if basename in self.recordings:
-                row = self.recordings[basename]['row']
-                self.streams_table.setItem(row, 4, QTableWidgetItem(f"{size_mb:.1f}"))
+            for recording in self.recordings.values():
+                recording['duration'] += 1
+                recording['duration_item'].setText(self.format_duration(recording['duration']))
+                size_mb = recording['thread'].bytes_written * _ONE_OVER_MB
+                size_text = f"{size_mb:.1f}"
+                if size_text != recording['size_text']:
+                    recording['size_text'] = size_text
+                    recording['size_item'].setText(size_text)
         except Exception as e:
-            logging.error(f"Error updating file size: {e}")
+            logging.error(f"Error updating recording rows: {e}")
 
     def stop_recording(self, filename):
         try:
@@ -728,13 +877,7 @@ class TangoVideoRecorder(QWidget):
                     recording['thread'].stop()
                     recording['thread'].wait()
                 
-                row = recording['row']
-                self.streams_table.setItem(row, 1, QTableWidgetItem('Stopped'))
-                
-                if self.streams_table.cellWidget(row, 6):
-                    self.streams_table.cellWidget(row, 6).setEnabled(False)
-                
-                self.queue_status_update('stopped', recording['output_file'])
+                self.update_recording_status('stopped', recording['output_file'])
                 
         except Exception as e:
             logging.error(f"Error stopping recording: {e}")
@@ -742,17 +885,25 @@ class TangoVideoRecorder(QWidget):
 
     def closeEvent(self, event):
         try:
-            for filename, recording in list(self.recordings.items()):
-                if recording['thread'].isRunning():
-                    self.stop_recording(filename)
-                    recording['thread'].wait()
-            
-            for recording in self.recordings.values():
-                if recording['thread'].isRunning():
-                    recording['thread'].wait()
-            
-            self.update_timer.stop()
+            # Signal every recording first so they all wind down in parallel,
+            # then wait for each; a serial stop+wait would block shutdown on
+            # the slowest stream at every step.
+            recordings = list(self.recordings.values())
+            for recording in recordings:
+                recording['thread'].stop()
+
+            for recording in recordings:
+                recording['thread'].wait()
             
+            if self._save_pending:
+                self._save_pending = False
+                self.save_streams(pretty=True)
+
+            self._flush_stats_if_dirty()
+
+            if RecordingSupervisor._instance is not None:
+                RecordingSupervisor._instance.shutdown()
+
             self.tray_icon.hide()
             
             event.accept()
@@ -761,15 +912,30 @@ class TangoVideoRecorder(QWidget):
             event.accept()
 
     def schedule_recording(self):
-        dialog = ScheduleDialog(self)
+        if self._schedule_dialog is None:
+            self._schedule_dialog = ScheduleDialog(self)
+        dialog = self._schedule_dialog
+        dialog.start_time.setDateTime(datetime.now())
+        dialog.duration.setValue(dialog.duration.minimum())
         if dialog.exec_():
             start_time = dialog.start_time.dateTime().toPyDateTime()
             duration = dialog.duration.value()
             
             delay = (start_time - datetime.now()).total_seconds()
             if delay > 0:
-                QTimer.singleShot(int(delay * 1000), 
-                                lambda: self.start_scheduled_recording(duration))
+                deadline = time.monotonic() + delay
+                QTimer.singleShot(int(delay * 1000),
+                                lambda: self._fire_scheduled_recording(deadline, duration))
+
+    def _fire_scheduled_recording(self, deadline, duration):
+        # Qt timers are coarse and wall-clock adjustments can fire early;
+        # check against the monotonic deadline and sleep off any residual.
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            QTimer.singleShot(int(remaining * 1000) + 1,
+                            lambda: self._fire_scheduled_recording(deadline, duration))
+        else:
+            self.start_scheduled_recording(duration)
 
     def start_scheduled_recording(self, duration):
         self.duration_input.setText(str(duration * 60))
@@ -779,23 +945,48 @@ class TangoVideoRecorder(QWidget):
         self.stats['total_recordings'] += 1
         self.stats['total_duration'] += duration
         self.stats['total_size'] += size
-        self.save_stats()
+        self._stats_dirty = True
+        self._stats_text_cache = None
+
+    def _flush_stats_if_dirty(self):
+        if self._stats_dirty:
+            self._stats_dirty = False
+            self.save_stats()
 
     def show_stats(self):
-        msg = QMessageBox()
-        msg.setWindowTitle('Recording Statistics')
-        msg.setText(f"""
+        if self._stats_msgbox is None:
+            self._stats_msgbox = QMessageBox()
+            self._stats_msgbox.setWindowTitle('Recording Statistics')
+        msg = self._stats_msgbox
+        if self._stats_text_cache is None:
+            self._stats_text_cache = f"""
         Total Recordings: {self.stats['total_recordings']}
         Total Duration: {self.format_duration(self.stats['total_duration'])}
         Total Size: {self.stats['total_size'] / 1024:.1f} GB
-        """)
+        """
+        msg.setText(self._stats_text_cache)
         msg.exec_()
 
     def load_stats(self):
+        """Read stats from disk once at startup.
+
+        Only called from __init__; afterwards self.stats is the authoritative
+        copy and the file is never re-read, only flushed by save_stats.
+        """
         try:
             if os.path.exists(self.stats_file):
-                with open(self.stats_file, 'r') as f:
+                with open(self.stats_file, 'rb') as f:
+                    recordings, duration, size_kb = _STATS_STRUCT.unpack(f.read(_STATS_STRUCT.size))
+                self.stats = {
+                    'total_recordings': recordings,
+                    'total_duration': duration,
+                    'total_size': size_kb / 1024
+                }
+            elif os.path.exists(self.legacy_stats_file):
+                # One-time upgrade from the old JSON stats file.
+                with open(self.legacy_stats_file, 'r') as f:
                     self.stats = json.load(f)
+                self.save_stats()
             else:
                 self.stats = {
                     'total_recordings': 0,
@@ -812,8 +1003,17 @@ class TangoVideoRecorder(QWidget):
 
     def save_stats(self):
         try:
-            with open(self.stats_file, 'w') as f:
-                json.dump(self.stats, f, indent=4)
+            payload = _STATS_STRUCT.pack(
+                int(self.stats['total_recordings']),
+                int(self.stats['total_duration']),
+                int(self.stats['total_size'] * 1024)
+            )
+            f = QSaveFile(self.stats_file)
+            if not f.open(QIODevice.WriteOnly):
+                raise IOError(f"Could not open {self.stats_file} for writing")
+            f.write(payload)
+            if not f.commit():
+                raise IOError(f"Could not commit {self.stats_file}")
         except Exception as e:
             logging.error(f"Error saving stats: {e}")
 